@@ -5,15 +5,9 @@ import logging
 import os
 import uuid
 
-from langchain_core.messages import HumanMessage
-
-from rssfeed_agent.agent import create_agent
 from rssfeed_agent.database import Database
-from rssfeed_agent.poller import start_polling
-from rssfeed_agent.tools import set_database
 
 DEFAULT_DB_PATH = "rssfeed_agent.db"
-CHECKPOINT_DB_PATH = "rssfeed_agent_checkpoints.db"
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +21,8 @@ logging.getLogger("langchain").setLevel(logging.WARNING)
 
 async def chat_loop(agent, config: dict) -> None:
     """Run the interactive chat loop."""
+    from langchain_core.messages import HumanMessage
+
     print("RSS Feed Agent ready! Type your message (Ctrl+C to quit).\n")
 
     while True:
@@ -39,8 +35,7 @@ async def chat_loop(agent, config: dict) -> None:
             continue
 
         try:
-            response = await asyncio.to_thread(
-                agent.invoke,
+            response = await agent.ainvoke(
                 {"messages": [HumanMessage(content=user_input)]},
                 config,
             )
@@ -60,15 +55,23 @@ async def chat_loop(agent, config: dict) -> None:
 
 async def main() -> None:
     """Initialize and run the RSS Feed Agent."""
+    # Deferred: importing the langchain/langgraph stack dominates startup
+    # time, so the process gets through logging setup and environment
+    # handling before paying for it.
+    from rssfeed_agent.agent import close_checkpointers, create_agent
+    from rssfeed_agent.poller import start_polling
+    from rssfeed_agent.tools import set_database
+
     db_path = os.environ.get("RSS_DB_PATH", DEFAULT_DB_PATH)
-    checkpoint_path = os.environ.get("RSS_CHECKPOINT_PATH", CHECKPOINT_DB_PATH)
+    # Durable checkpoints are opt-in; sessions use fresh threads, so the
+    # default in-memory checkpointer loses nothing.
+    checkpoint_path = os.environ.get("RSS_CHECKPOINT_PATH")
 
     # Initialize database
     db = Database(db_path)
     db.connect()
     set_database(db)
 
-    # Create agent with separate checkpoint database
     agent = create_agent(checkpoint_db_path=checkpoint_path)
 
     # Each session gets a fresh thread to avoid corrupted checkpoint issues
@@ -88,6 +91,9 @@ async def main() -> None:
             await poller_task
         except asyncio.CancelledError:
             pass
+        # Stop aiosqlite's worker threads before the loop goes away —
+        # they are non-daemon and would keep the process alive.
+        await close_checkpointers()
         db.close()
 
 
@@ -1,11 +1,14 @@
 """LangGraph agent definition for RSS Feed Agent."""
 
-import sqlite3
 from typing import Literal
 
+import aiosqlite
 from langchain_anthropic import ChatAnthropic
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_core.messages import SystemMessage, ToolMessage
-from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, START, MessagesState, StateGraph
 
 from rssfeed_agent.tools import (
@@ -46,15 +49,50 @@ Be concise but informative in your responses."""
 # All tools available to the agent
 TOOLS = [subscribe_to_feed, get_items, list_feeds, unsubscribe_from_feed, search_items, mark_as_read, mark_as_unread]
 
+# One checkpointer (and thus one aiosqlite connection) per checkpoint
+# database path. Re-creating the agent must not stack fresh connections
+# on the same WAL file.
+_checkpointers: dict[str, AsyncSqliteSaver] = {}
+
+
+def _get_checkpointer(checkpoint_db_path: str) -> AsyncSqliteSaver:
+    """Return the shared AsyncSqliteSaver for a checkpoint database path."""
+    saver = _checkpointers.get(checkpoint_db_path)
+    if saver is None:
+        saver = AsyncSqliteSaver(aiosqlite.connect(checkpoint_db_path))
+        _checkpointers[checkpoint_db_path] = saver
+    return saver
+
+
+async def close_checkpointers() -> None:
+    """Close every cached checkpointer's aiosqlite connection.
+
+    aiosqlite runs a non-daemon worker thread per connection, so without
+    an explicit close the interpreter never exits once a durable
+    checkpointer has been used. Safe to call when no checkpointer was
+    ever created.
+    """
+    for saver in _checkpointers.values():
+        try:
+            await saver.conn.close()
+        except ValueError:
+            # Connection was never awaited, so no worker thread to stop.
+            pass
+    _checkpointers.clear()
+
 
 def create_agent(
-    checkpoint_db_path: str = "rssfeed_agent_checkpoints.db",
+    checkpoint_db_path: str | None = None,
     tools: list | None = None,
 ):
     """Create and compile the LangGraph agent.
 
     Args:
-        checkpoint_db_path: Path to SQLite database for LangGraph checkpointing.
+        checkpoint_db_path: Optional path to a SQLite database for durable
+            LangGraph checkpointing. When None (the default), conversation
+            state is checkpointed in memory only — every session starts a
+            fresh thread anyway, so there is nothing to resume from disk
+            and each turn skips the checkpoint write/fsync entirely.
         tools: List of tool functions to bind to the agent. If None, uses default TOOLS.
 
     Returns:
@@ -63,6 +101,12 @@ def create_agent(
     if tools is None:
         tools = TOOLS
 
+    # Cache model responses keyed on the exact prompt. With temperature=0
+    # a repeated prompt (e.g. a retried turn after a tool error) produces
+    # the same answer anyway, so serving it from memory skips the API
+    # round-trip.
+    set_llm_cache(InMemoryCache())
+
     model = ChatAnthropic(
         model="claude-sonnet-4-5-20250929",
         temperature=0,
@@ -75,19 +119,19 @@ def create_agent(
 
     tools_by_name = {tool.name: tool for tool in tools}
 
-    def agent_node(state: MessagesState):
+    async def agent_node(state: MessagesState):
         """LLM call node — decides whether to use a tool or respond directly."""
         messages = [SystemMessage(content=SYSTEM_PROMPT)] + state["messages"]
-        response = model_with_tools.invoke(messages)
+        response = await model_with_tools.ainvoke(messages)
         return {"messages": [response]}
 
-    def tool_node(state: MessagesState):
+    async def tool_node(state: MessagesState):
         """Execute tool calls from the LLM response."""
         results = []
         last_message = state["messages"][-1]
         for tool_call in last_message.tool_calls:
             tool = tools_by_name[tool_call["name"]]
-            result = tool.invoke(tool_call["args"])
+            result = await tool.ainvoke(tool_call["args"])
             results.append(
                 ToolMessage(content=str(result), tool_call_id=tool_call["id"])
             )
@@ -109,8 +153,13 @@ def create_agent(
     builder.add_conditional_edges("agent_node", should_continue, ["tool_node", END])
     builder.add_edge("tool_node", "agent_node")
 
-    # Compile with SQLite checkpointer for persistence
-    checkpointer = SqliteSaver(sqlite3.connect(checkpoint_db_path, check_same_thread=False))
+    # In-memory checkpointing by default; the async SQLite checkpointer is
+    # only worth its I/O when a caller actually wants durable threads.
+    # Must be called from a running event loop when a path is given.
+    if checkpoint_db_path:
+        checkpointer = _get_checkpointer(checkpoint_db_path)
+    else:
+        checkpointer = InMemorySaver()
     agent = builder.compile(checkpointer=checkpointer)
 
     return agent
@@ -1,9 +1,18 @@
 """SQLite database operations for RSS Feed Agent."""
 
+import asyncio
+import functools
+import json
+import queue
+import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator
 
-from rssfeed_agent.models import Feed, Item
+from rssfeed_agent.models import Feed, Item, utc_now
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS feeds (
@@ -12,7 +21,10 @@ CREATE TABLE IF NOT EXISTS feeds (
     title TEXT NOT NULL,
     description TEXT,
     site_link TEXT,
-    last_fetched_at TEXT,
+    last_fetched_at INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
     error_count INTEGER DEFAULT 0,
     last_error TEXT,
     is_active INTEGER DEFAULT 1,
@@ -26,16 +38,20 @@ CREATE TABLE IF NOT EXISTS items (
     title TEXT NOT NULL,
     link TEXT,
     summary TEXT,
-    published_at TEXT,
+    published_at INTEGER,
     is_read INTEGER DEFAULT 0,
-    fetched_at TEXT NOT NULL DEFAULT (datetime('now')),
+    fetched_at INTEGER NOT NULL DEFAULT (unixepoch()),
     UNIQUE(feed_id, guid)
 );
 
-CREATE INDEX IF NOT EXISTS idx_items_feed_id ON items(feed_id);
 CREATE INDEX IF NOT EXISTS idx_items_published_at ON items(published_at);
 CREATE INDEX IF NOT EXISTS idx_items_is_read ON items(is_read);
 
+-- Serves the get_recent_items hot path: equality on feed_id, range on
+-- published_at, and the ORDER BY published_at DESC come straight off the
+-- index without a sort. Also covers plain feed_id lookups.
+CREATE INDEX IF NOT EXISTS idx_items_feed_published ON items(feed_id, published_at DESC);
+
 CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
     title,
     summary,
@@ -57,26 +73,163 @@ CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
 END;
 """
 
+# Applied on every connection. WAL + synchronous=NORMAL keeps durability at
+# the checkpoint level while halving fsyncs; the cache/mmap settings let
+# reads on the hot paths (get_recent_items, FTS search) be served from
+# memory; busy_timeout covers transient contention between the poller and
+# the chat thread.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Select list shared by get_recent_items and search_items, shaped exactly
+# like the dicts the item tools emit: summary truncation and timestamp
+# rendering happen inside SQLite instead of per-row Python code.
+ITEM_RESULT_COLUMNS = """
+    items.id,
+    feeds.title AS feed_title,
+    items.title,
+    items.link,
+    substr(coalesce(items.summary, ''), 1, 200) AS summary,
+    strftime('%Y-%m-%dT%H:%M:%S', items.published_at, 'unixepoch') AS published_at,
+    items.is_read
+"""
+
+# Single FTS search statement: match, rank, and LIMIT all happen inside
+# SQLite. Kept as a module constant so every call presents the identical
+# SQL text and hits the connection's prepared-statement cache.
+SEARCH_ITEMS_SQL = f"""
+    SELECT {ITEM_RESULT_COLUMNS}
+    FROM items_fts
+    JOIN items ON items.id = items_fts.rowid
+    JOIN feeds ON items.feed_id = feeds.id
+    WHERE items_fts MATCH ?
+    ORDER BY items_fts.rank
+    LIMIT ?
+"""
+
+# Poll-cycle write statements, hoisted so add_items and
+# record_poll_results present byte-identical SQL to the writer
+# connection's prepared-statement cache on every cycle.
+INSERT_ITEMS_SQL = """
+    INSERT OR IGNORE INTO items (feed_id, guid, title, link, summary,
+                                 published_at, is_read, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Narrower insert for poll-cycle rows: is_read falls to its schema
+# default, so the poller never materializes it. fetched_at is bound
+# explicitly — tables migrated from the original schema still carry its
+# old DEFAULT (datetime('now')), which would store ISO text where every
+# reader now expects epoch integers.
+INSERT_POLL_ITEMS_SQL = """
+    INSERT OR IGNORE INTO items (feed_id, guid, title, link, summary,
+                                 published_at, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+FEED_POLLED_OK_SQL = """
+    UPDATE feeds SET last_fetched_at = ?, etag = ?, last_modified = ?,
+                     content_hash = ?, error_count = 0, last_error = NULL
+    WHERE id = ?
+"""
+
+FEED_POLL_FAILED_SQL = """
+    UPDATE feeds SET error_count = error_count + 1, last_error = ?
+    WHERE id = ?
+"""
+
+# Tokenizer for user search queries, compiled once. FTS5 MATCH has its
+# own query syntax, so raw user text ("don't", "c++", stray quotes) must
+# be reduced to plain terms before it reaches the index.
+FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Per-connection prepared-statement cache. Large enough that the hot
+# statements (inserts, recent-item reads, FTS search) never get evicted.
+CACHED_STATEMENTS = 128
+
+# Number of read-only connections kept in the pool. Readers never block
+# each other under WAL, so a small pool covers the chat thread, tool
+# executions, and the poller.
+READ_POOL_SIZE = 4
+
 
 class Database:
-    """SQLite database manager for feeds and items."""
+    """SQLite database manager for feeds and items.
+
+    Writes are serialized through a dedicated writer thread so concurrent
+    callers (the chat loop, tool executions, the background poller) never
+    contend on a shared connection or hit SQLITE_BUSY. Reads go through a
+    small pool of read-only connections, which WAL allows to run
+    concurrently with the writer.
+    """
 
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._write_queue: queue.Queue[tuple[Callable, Future] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        # Bumped whenever the set of feeds changes; stale resolve_feed
+        # cache entries die with their version key.
+        self._feeds_version = 0
+        # Lazily-loaded set of (feed_id, guid) pairs already stored. Most
+        # feeds repeat the same entries across poll cycles; a set probe
+        # here skips binding and B-tree-probing those rows at all.
+        self._known_guids: set[tuple[int, str]] | None = None
+        self._resolve_cached = functools.lru_cache(maxsize=256)(self._resolve_feed)
 
     def connect(self) -> None:
-        """Open database connection and initialize schema."""
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("PRAGMA foreign_keys=ON")
+        """Open database connections, initialize schema, start the writer."""
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.row_factory = sqlite3.Row
         self._conn.executescript(SCHEMA_SQL)
-        self._conn.commit()
+        with self._conn:
+            self._migrate()
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="db-writer", daemon=True
+        )
+        self._writer.start()
+
+        # Schema exists now, so read-only connections can open the file.
+        for _ in range(READ_POOL_SIZE):
+            reader = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=CACHED_STATEMENTS,
+            )
+            for pragma in CONNECTION_PRAGMAS:
+                reader.execute(pragma)
+            reader.row_factory = sqlite3.Row
+            self._read_pool.put(reader)
 
     def close(self) -> None:
-        """Close database connection."""
+        """Stop the writer thread and close all connections."""
+        if self._writer:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
         if self._conn:
+            # Fold the WAL back into the main database file so it doesn't
+            # grow unboundedly across sessions.
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             self._conn.close()
             self._conn = None
 
@@ -86,61 +239,147 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._conn
 
+    def _migrate(self) -> None:
+        """Add columns introduced after the initial schema to existing databases."""
+        columns = {
+            row["name"]
+            for row in self._conn.execute("PRAGMA table_info(feeds)").fetchall()
+        }
+        for name in ("etag", "last_modified", "content_hash"):
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE feeds ADD COLUMN {name} TEXT")
+        # Superseded by idx_items_feed_published (same leading column).
+        self._conn.execute("DROP INDEX IF EXISTS idx_items_feed_id")
+        # Item timestamps moved from ISO-8601 text to unix epoch integers;
+        # convert any rows written by earlier versions in place. Legacy
+        # tables keep TEXT affinity on these columns, so converted values
+        # land as epoch digit strings and still satisfy the typeof guard
+        # on the next connect — the GLOB term (contains a non-digit ⇒ not
+        # yet converted) keeps the statement idempotent, as strftime('%s')
+        # on bare digit strings yields NULL, not an epoch.
+        self._conn.execute(
+            """UPDATE items SET published_at = CAST(strftime('%s', published_at) AS INTEGER)
+               WHERE typeof(published_at) = 'text'
+                 AND published_at GLOB '*[^0-9]*'"""
+        )
+        self._conn.execute(
+            """UPDATE items SET fetched_at = CAST(strftime('%s', fetched_at) AS INTEGER)
+               WHERE typeof(fetched_at) = 'text'
+                 AND fetched_at GLOB '*[^0-9]*'"""
+        )
+        self._conn.execute(
+            """UPDATE feeds SET last_fetched_at = CAST(strftime('%s', last_fetched_at) AS INTEGER)
+               WHERE typeof(last_fetched_at) = 'text'
+                 AND last_fetched_at GLOB '*[^0-9]*'"""
+        )
+
+    def _writer_loop(self) -> None:
+        """Consume write operations from the queue on the writer thread."""
+        while True:
+            entry = self._write_queue.get()
+            if entry is None:
+                break
+            op, future = entry
+            try:
+                with self._conn:
+                    result = op(self._conn)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _write(self, op: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a write operation on the writer thread inside a transaction."""
+        if self._writer is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        future: Future = Future()
+        self._write_queue.put((op, future))
+        return future.result()
+
+    def _read(self, op: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a read operation on a pooled read-only connection."""
+        reader = self._read_pool.get()
+        try:
+            return op(reader)
+        finally:
+            self._read_pool.put(reader)
+
     # --- Feed operations ---
 
     def add_feed(self, feed: Feed) -> Feed:
         """Insert a new feed and return it with its assigned id."""
-        cursor = self.conn.execute(
-            """INSERT INTO feeds (url, title, description, site_link, last_fetched_at,
-               error_count, last_error, is_active, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                feed.url,
-                feed.title,
-                feed.description,
-                feed.site_link,
-                _dt_to_str(feed.last_fetched_at),
-                feed.error_count,
-                feed.last_error,
-                int(feed.is_active),
-                _dt_to_str(feed.created_at),
-            ),
-        )
-        self.conn.commit()
-        feed.id = cursor.lastrowid
+        def op(conn: sqlite3.Connection) -> int | None:
+            cursor = conn.execute(
+                """INSERT INTO feeds (url, title, description, site_link, last_fetched_at,
+                   etag, last_modified, content_hash, error_count, last_error, is_active, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    feed.url,
+                    feed.title,
+                    feed.description,
+                    feed.site_link,
+                    _dt_to_ts(feed.last_fetched_at),
+                    feed.etag,
+                    feed.last_modified,
+                    feed.content_hash,
+                    feed.error_count,
+                    feed.last_error,
+                    int(feed.is_active),
+                    _dt_to_str(feed.created_at),
+                ),
+            )
+            return cursor.lastrowid
+
+        feed.id = self._write(op)
+        self._feeds_version += 1
         return feed
 
     def get_feed_by_url(self, url: str) -> Feed | None:
         """Look up a feed by its URL."""
-        row = self.conn.execute(
-            "SELECT * FROM feeds WHERE url = ?", (url,)
-        ).fetchone()
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds WHERE url = ?", (url,)
+            ).fetchone()
+        )
         return _row_to_feed(row) if row else None
 
     def get_feed_by_id(self, feed_id: int) -> Feed | None:
         """Look up a feed by its id."""
-        row = self.conn.execute(
-            "SELECT * FROM feeds WHERE id = ?", (feed_id,)
-        ).fetchone()
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds WHERE id = ?", (feed_id,)
+            ).fetchone()
+        )
         return _row_to_feed(row) if row else None
 
     def get_all_feeds(self) -> list[Feed]:
         """Return all feeds."""
-        rows = self.conn.execute(
-            "SELECT * FROM feeds ORDER BY created_at DESC"
-        ).fetchall()
+        rows = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds ORDER BY created_at DESC"
+            ).fetchall()
+        )
         return [_row_to_feed(r) for r in rows]
 
     def delete_feed(self, feed_id: int) -> bool:
         """Delete a feed and its items (cascade). Returns True if deleted."""
-        cursor = self.conn.execute("DELETE FROM feeds WHERE id = ?", (feed_id,))
-        self.conn.commit()
-        return cursor.rowcount > 0
+        rowcount = self._write(
+            lambda conn: conn.execute(
+                "DELETE FROM feeds WHERE id = ?", (feed_id,)
+            ).rowcount
+        )
+        self._feeds_version += 1
+        if self._known_guids is not None:
+            # Items went with the feed via ON DELETE CASCADE.
+            self._known_guids = {
+                key for key in self._known_guids if key[0] != feed_id
+            }
+        return rowcount > 0
 
     def subscribe_to_feed(
         self, feed: Feed, items: list[Item]
     ) -> tuple[Feed, int]:
-        """Subscribe to a feed: check for duplicates, insert feed and items.
+        """Subscribe to a feed: insert feed and items, rejecting duplicates.
 
         Args:
             feed: Feed to subscribe to.
@@ -152,11 +391,12 @@ class Database:
         Raises:
             ValueError: If already subscribed to this URL.
         """
-        existing = self.get_feed_by_url(feed.url)
-        if existing:
-            raise ValueError(f"Already subscribed to this feed")
-
-        saved_feed = self.add_feed(feed)
+        # The UNIQUE constraint on feeds.url is the duplicate check; no
+        # separate SELECT round-trip, and no race window between them.
+        try:
+            saved_feed = self.add_feed(feed)
+        except sqlite3.IntegrityError:
+            raise ValueError("Already subscribed to this feed") from None
 
         # Set feed_id on all items
         for item in items:
@@ -167,47 +407,50 @@ class Database:
 
     def get_item_count_for_feed(self, feed_id: int) -> int:
         """Get the number of items stored for a feed."""
-        row = self.conn.execute(
-            "SELECT COUNT(*) as cnt FROM items WHERE feed_id = ?", (feed_id,)
-        ).fetchone()
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT COUNT(*) as cnt FROM items WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+        )
         return row["cnt"] if row else 0
 
     # --- Item operations ---
 
     def add_items(self, items: list[Item]) -> int:
         """Bulk-insert items, skipping duplicates. Returns count of inserted items."""
-        inserted = 0
-        for item in items:
-            try:
-                self.conn.execute(
-                    """INSERT INTO items (feed_id, guid, title, link, summary,
-                       published_at, is_read, fetched_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        item.feed_id,
-                        item.guid,
-                        item.title,
-                        item.link,
-                        item.summary,
-                        _dt_to_str(item.published_at),
-                        int(item.is_read),
-                        _dt_to_str(item.fetched_at),
-                    ),
-                )
-                inserted += 1
-            except sqlite3.IntegrityError:
-                # Duplicate (feed_id, guid) — skip
-                continue
-        self.conn.commit()
+        if not items:
+            return 0
+        rows = [
+            (
+                item.feed_id,
+                item.guid,
+                item.title,
+                item.link,
+                item.summary,
+                _dt_to_ts(item.published_at),
+                int(item.is_read),
+                _dt_to_ts(item.fetched_at),
+            )
+            for item in items
+        ]
+        # Single transaction: one commit (and one WAL fsync) for the whole
+        # batch, with OR IGNORE handling (feed_id, guid) duplicates in SQL.
+        inserted = self._write(
+            lambda conn: conn.executemany(INSERT_ITEMS_SQL, rows).rowcount
+        )
+        if self._known_guids is not None:
+            self._known_guids.update((item.feed_id, item.guid) for item in items)
         return inserted
 
     def get_items_by_feed_id(self, feed_id: int, limit: int = 50) -> list[Item]:
         """Get items for a specific feed, ordered by publication date."""
-        rows = self.conn.execute(
-            """SELECT * FROM items WHERE feed_id = ?
-               ORDER BY published_at DESC LIMIT ?""",
-            (feed_id, limit),
-        ).fetchall()
+        rows = self._read(
+            lambda conn: conn.execute(
+                """SELECT * FROM items WHERE feed_id = ?
+                   ORDER BY published_at DESC LIMIT ?""",
+                (feed_id, limit),
+            ).fetchall()
+        )
         return [_row_to_item(r) for r in rows]
 
     def get_recent_items(
@@ -217,13 +460,18 @@ class Database:
         since: datetime | None = None,
         until: datetime | None = None,
         unread_only: bool = False,
-    ) -> list[dict]:
+    ) -> tuple[list[dict], int]:
         """Get recent items with feed title, optionally filtered.
 
-        Returns dicts (not Item objects) to include feed_title from join.
+        Returns (items, total): dicts already in the shape the item tools
+        emit (see ITEM_RESULT_COLUMNS), plus the full count of rows
+        matching the filters regardless of limit. The count rides along
+        as a window function, so one traversal serves both — a separate
+        COUNT(*) query would evaluate the same predicates a second time.
         """
-        query = """
-            SELECT items.*, feeds.title as feed_title
+        query = f"""
+            SELECT {ITEM_RESULT_COLUMNS},
+                   COUNT(*) OVER () AS total
             FROM items
             JOIN feeds ON items.feed_id = feeds.id
             WHERE 1=1
@@ -235,32 +483,22 @@ class Database:
             params.append(feed_id)
         if since is not None:
             query += " AND items.published_at >= ?"
-            params.append(_dt_to_str(since))
+            params.append(_dt_to_ts(since))
         if until is not None:
             query += " AND items.published_at <= ?"
-            params.append(_dt_to_str(until))
+            params.append(_dt_to_ts(until))
         if unread_only:
             query += " AND items.is_read = 0"
 
         query += " ORDER BY items.published_at DESC LIMIT ?"
         params.append(limit)
 
-        rows = self.conn.execute(query, params).fetchall()
-        return [
-            {
-                "id": r["id"],
-                "feed_id": r["feed_id"],
-                "feed_title": r["feed_title"],
-                "guid": r["guid"],
-                "title": r["title"],
-                "link": r["link"],
-                "summary": r["summary"],
-                "published_at": r["published_at"],
-                "is_read": bool(r["is_read"]),
-                "fetched_at": r["fetched_at"],
-            }
-            for r in rows
-        ]
+        rows = self._read(lambda conn: conn.execute(query, params).fetchall())
+        payloads = _rows_to_payloads(rows)
+        total = 0
+        for payload in payloads:
+            total = payload.pop("total")
+        return payloads, total
 
     def get_total_item_count(
         self,
@@ -278,139 +516,369 @@ class Database:
             params.append(feed_id)
         if since is not None:
             query += " AND published_at >= ?"
-            params.append(_dt_to_str(since))
+            params.append(_dt_to_ts(since))
         if until is not None:
             query += " AND published_at <= ?"
-            params.append(_dt_to_str(until))
+            params.append(_dt_to_ts(until))
         if unread_only:
             query += " AND is_read = 0"
 
-        row = self.conn.execute(query, params).fetchone()
+        row = self._read(lambda conn: conn.execute(query, params).fetchone())
         return row["cnt"] if row else 0
 
     def get_new_items_count_since(self, timestamp: datetime) -> int:
         """Count items fetched since the given timestamp (for hybrid notification)."""
-        row = self.conn.execute(
-            "SELECT COUNT(*) as cnt FROM items WHERE fetched_at >= ?",
-            (_dt_to_str(timestamp),),
-        ).fetchone()
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT COUNT(*) as cnt FROM items WHERE fetched_at >= ?",
+                (_dt_to_ts(timestamp),),
+            ).fetchone()
+        )
         return row["cnt"] if row else 0
 
-    def update_feed_last_fetched(self, feed_id: int, timestamp: datetime) -> None:
-        """Update a feed's last_fetched_at timestamp."""
-        self.conn.execute(
-            "UPDATE feeds SET last_fetched_at = ? WHERE id = ?",
-            (_dt_to_str(timestamp), feed_id),
+    def update_feed_last_fetched(
+        self,
+        feed_id: int,
+        timestamp: datetime | int,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
+    ) -> None:
+        """Update a feed's last_fetched_at timestamp and cache validators.
+
+        Validator arguments left as None keep the feed's stored values,
+        so a bare update_feed_last_fetched(feed_id, ts) cannot wipe a
+        feed's validators and silently disable its conditional GETs.
+        """
+        self._write(
+            lambda conn: conn.execute(
+                """UPDATE feeds SET last_fetched_at = ?,
+                   etag = COALESCE(?, etag),
+                   last_modified = COALESCE(?, last_modified),
+                   content_hash = COALESCE(?, content_hash)
+                   WHERE id = ?""",
+                (_dt_to_ts(timestamp), etag, last_modified, content_hash, feed_id),
+            )
         )
-        self.conn.commit()
 
     def update_feed_error(
         self, feed_id: int, error_message: str
     ) -> None:
         """Increment error count and store error message for a feed."""
-        self.conn.execute(
-            """UPDATE feeds SET error_count = error_count + 1, last_error = ?
-               WHERE id = ?""",
-            (error_message, feed_id),
+        self._write(
+            lambda conn: conn.execute(
+                """UPDATE feeds SET error_count = error_count + 1, last_error = ?
+                   WHERE id = ?""",
+                (error_message, feed_id),
+            )
         )
-        self.conn.commit()
 
     def reset_feed_error(self, feed_id: int) -> None:
         """Reset error count and clear error message on successful fetch."""
-        self.conn.execute(
-            "UPDATE feeds SET error_count = 0, last_error = NULL WHERE id = ?",
-            (feed_id,),
+        self._write(
+            lambda conn: conn.execute(
+                "UPDATE feeds SET error_count = 0, last_error = NULL WHERE id = ?",
+                (feed_id,),
+            )
         )
-        self.conn.commit()
+
+    def _get_known_guids(self) -> set[tuple[int, str]]:
+        """Return the in-memory (feed_id, guid) set, loading it on first use."""
+        if self._known_guids is None:
+            rows = self._read(
+                lambda conn: conn.execute("SELECT feed_id, guid FROM items").fetchall()
+            )
+            self._known_guids = {(r["feed_id"], r["guid"]) for r in rows}
+        return self._known_guids
+
+    def record_poll_results(
+        self,
+        item_rows: Iterable[tuple],
+        successes: list[tuple[int, datetime | int, str | None, str | None, str | None]],
+        failures: list[tuple[int, str]],
+    ) -> int:
+        """Persist an entire poll cycle's writes in a single transaction.
+
+        Args:
+            item_rows: (feed_id, guid, title, link, summary, published_at)
+                per new item, bulk-inserted with duplicate (feed_id, guid)
+                rows skipped; is_read takes its schema default and
+                fetched_at is stamped with one epoch for the whole batch.
+                Plain tuples rather than Item objects — the
+                poller produces thousands of these per cycle and nothing
+                downstream needs the typed wrapper. Any iterable works;
+                rows stream into the insert without being re-materialized.
+            successes: (feed_id, timestamp, etag, last_modified,
+                content_hash) per successfully polled feed; resets its
+                error state.
+            failures: (feed_id, error_message) per failed feed; increments
+                its error count.
+
+        Returns:
+            Count of inserted items.
+        """
+        known = self._get_known_guids()
+        attempted: list[tuple[int, str]] = []
+        fetched = int(time.time())
+
+        def rows() -> Iterator[tuple]:
+            # Generator feeding executemany directly: filtered, converted
+            # rows never pile up in a second list alongside the caller's.
+            for feed_id, guid, title, link, summary, published_at in item_rows:
+                key = (feed_id, guid)
+                if key in known:
+                    continue
+                attempted.append(key)
+                yield (feed_id, guid, title, link, summary, _dt_to_ts(published_at), fetched)
+
+        def op(conn: sqlite3.Connection) -> int:
+            cursor = conn.executemany(INSERT_POLL_ITEMS_SQL, rows())
+            conn.executemany(
+                FEED_POLLED_OK_SQL,
+                [
+                    (_dt_to_ts(timestamp), etag, last_modified, content_hash, feed_id)
+                    for feed_id, timestamp, etag, last_modified, content_hash in successes
+                ],
+            )
+            conn.executemany(
+                FEED_POLL_FAILED_SQL,
+                [(message, feed_id) for feed_id, message in failures],
+            )
+            return cursor.rowcount
+
+        inserted = self._write(op)
+        # Rows the insert ignored anyway exist in the table, so recording
+        # every attempted key keeps the set truthful.
+        known.update(attempted)
+        return inserted
 
     def get_active_feeds(self) -> list[Feed]:
         """Return all active feeds (for polling)."""
-        rows = self.conn.execute(
-            "SELECT * FROM feeds WHERE is_active = 1 ORDER BY id"
-        ).fetchall()
+        rows = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds WHERE is_active = 1 ORDER BY id"
+            ).fetchall()
+        )
         return [_row_to_feed(r) for r in rows]
 
     def find_feeds_by_identifier(self, identifier: str) -> list[Feed]:
-        """Find feeds by title (case-insensitive substring) or URL."""
-        rows = self.conn.execute(
-            """SELECT * FROM feeds
-               WHERE url = ? OR title LIKE ? COLLATE NOCASE""",
-            (identifier, f"%{identifier}%"),
-        ).fetchall()
+        """Find feeds by URL (exact) or title (case-insensitive substring)."""
+        # Exact URL hits resolve off the unique index; the OR in the old
+        # combined query forced a full scan even for URL lookups. An exact
+        # match is also unambiguous, so nothing is lost by returning early.
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds WHERE url = ?", (identifier,)
+            ).fetchone()
+        )
+        if row:
+            return [_row_to_feed(row)]
+
+        rows = self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM feeds WHERE title LIKE ? COLLATE NOCASE",
+                (f"%{identifier}%",),
+            ).fetchall()
+        )
         return [_row_to_feed(r) for r in rows]
 
+    def resolve_feed(self, identifier: str) -> list[Feed]:
+        """Resolve an identifier to candidate feeds, with caching.
+
+        An exact URL match is unambiguous and comes back alone; otherwise
+        every title match is returned and the caller decides how to break
+        the tie. Agent turns tend to name the same feed repeatedly, so
+        results are cached until the set of feeds changes.
+        """
+        return self._resolve_cached(identifier, self._feeds_version)
+
+    def _resolve_feed(self, identifier: str, version: int) -> list[Feed]:
+        """Uncached resolve_feed body; version only serves as a cache key."""
+        return self.find_feeds_by_identifier(identifier)
+
+    def get_existing_guids(self, feed_id: int, guids: list[str]) -> set[str]:
+        """Return the subset of guids already stored for a feed.
+
+        One query per feed instead of one per candidate item; the guid
+        list travels as a single JSON parameter.
+        """
+        if not guids:
+            return set()
+        rows = self._read(
+            lambda conn: conn.execute(
+                """SELECT guid FROM items
+                   WHERE feed_id = ? AND guid IN (SELECT value FROM json_each(?))""",
+                (feed_id, json.dumps(guids)),
+            ).fetchall()
+        )
+        return {r["guid"] for r in rows}
+
     def item_exists_by_guid(self, feed_id: int, guid: str) -> bool:
         """Check if an item with the given guid exists for a feed."""
-        row = self.conn.execute(
-            "SELECT 1 FROM items WHERE feed_id = ? AND guid = ?",
-            (feed_id, guid),
-        ).fetchone()
+        if self._known_guids is not None:
+            return (feed_id, guid) in self._known_guids
+        row = self._read(
+            lambda conn: conn.execute(
+                "SELECT 1 FROM items WHERE feed_id = ? AND guid = ?",
+                (feed_id, guid),
+            ).fetchone()
+        )
         return row is not None
 
     def search_items(self, query: str, limit: int = 20) -> list[dict]:
         """Full-text search across item titles and summaries using FTS5.
 
-        Returns dicts with feed_title, ranked by relevance.
+        Returns dicts in the shape the item tools emit (see
+        ITEM_RESULT_COLUMNS), ranked by relevance.
         """
-        rows = self.conn.execute(
-            """SELECT items.*, feeds.title as feed_title,
-                      items_fts.rank
-               FROM items_fts
-               JOIN items ON items.id = items_fts.rowid
-               JOIN feeds ON items.feed_id = feeds.id
-               WHERE items_fts MATCH ?
-               ORDER BY items_fts.rank
-               LIMIT ?""",
-            (query, limit),
-        ).fetchall()
-        return [
-            {
-                "id": r["id"],
-                "feed_id": r["feed_id"],
-                "feed_title": r["feed_title"],
-                "guid": r["guid"],
-                "title": r["title"],
-                "link": r["link"],
-                "summary": r["summary"],
-                "published_at": r["published_at"],
-                "is_read": bool(r["is_read"]),
-                "fetched_at": r["fetched_at"],
-            }
-            for r in rows
-        ]
+        # All terms must match (implicit AND); quoting keeps FTS5 from
+        # interpreting tokens as query syntax.
+        terms = FTS_TOKEN_RE.findall(query)
+        if not terms:
+            return []
+        fts_query = " ".join(f'"{term}"' for term in terms)
+
+        rows = self._read(
+            lambda conn: conn.execute(SEARCH_ITEMS_SQL, (fts_query, limit)).fetchall()
+        )
+        return _rows_to_payloads(rows)
 
     def mark_items_read(self, item_ids: list[int]) -> int:
         """Mark specific items as read. Returns count of affected rows."""
         if not item_ids:
             return 0
-        placeholders = ",".join("?" for _ in item_ids)
-        cursor = self.conn.execute(
-            f"UPDATE items SET is_read = 1 WHERE id IN ({placeholders}) AND is_read = 0",
-            item_ids,
+        # id list travels as one JSON parameter, so the statement text is
+        # identical for any list size and stays in the statement cache.
+        return self._write(
+            lambda conn: conn.execute(
+                """UPDATE items SET is_read = 1
+                   WHERE id IN (SELECT value FROM json_each(?)) AND is_read = 0""",
+                (json.dumps(item_ids),),
+            ).rowcount
         )
-        self.conn.commit()
-        return cursor.rowcount
 
     def mark_feed_items_read(self, feed_id: int) -> int:
         """Mark all items in a feed as read. Returns count of affected rows."""
-        cursor = self.conn.execute(
-            "UPDATE items SET is_read = 1 WHERE feed_id = ? AND is_read = 0",
-            (feed_id,),
+        return self._write(
+            lambda conn: conn.execute(
+                "UPDATE items SET is_read = 1 WHERE feed_id = ? AND is_read = 0",
+                (feed_id,),
+            ).rowcount
         )
-        self.conn.commit()
-        return cursor.rowcount
 
     def mark_items_unread(self, item_ids: list[int]) -> int:
         """Mark specific items as unread. Returns count of affected rows."""
         if not item_ids:
             return 0
-        placeholders = ",".join("?" for _ in item_ids)
-        cursor = self.conn.execute(
-            f"UPDATE items SET is_read = 0 WHERE id IN ({placeholders}) AND is_read = 1",
-            item_ids,
+        return self._write(
+            lambda conn: conn.execute(
+                """UPDATE items SET is_read = 0
+                   WHERE id IN (SELECT value FROM json_each(?)) AND is_read = 1""",
+                (json.dumps(item_ids),),
+            ).rowcount
         )
-        self.conn.commit()
-        return cursor.rowcount
+
+    # --- Async wrappers ---
+    #
+    # The agent tools and the poller run on the asyncio event loop; calling
+    # the sync methods there would block the loop for the duration of the
+    # SQLite I/O. These wrappers push that work onto a thread.
+
+    async def aget_feed_by_url(self, *args, **kwargs) -> Feed | None:
+        """Async wrapper for get_feed_by_url."""
+        return await asyncio.to_thread(self.get_feed_by_url, *args, **kwargs)
+
+    async def aget_feed_by_id(self, *args, **kwargs) -> Feed | None:
+        """Async wrapper for get_feed_by_id."""
+        return await asyncio.to_thread(self.get_feed_by_id, *args, **kwargs)
+
+    async def aget_all_feeds(self, *args, **kwargs) -> list[Feed]:
+        """Async wrapper for get_all_feeds."""
+        return await asyncio.to_thread(self.get_all_feeds, *args, **kwargs)
+
+    async def adelete_feed(self, *args, **kwargs) -> bool:
+        """Async wrapper for delete_feed."""
+        return await asyncio.to_thread(self.delete_feed, *args, **kwargs)
+
+    async def asubscribe_to_feed(self, *args, **kwargs) -> tuple[Feed, int]:
+        """Async wrapper for subscribe_to_feed."""
+        return await asyncio.to_thread(self.subscribe_to_feed, *args, **kwargs)
+
+    async def aget_item_count_for_feed(self, *args, **kwargs) -> int:
+        """Async wrapper for get_item_count_for_feed."""
+        return await asyncio.to_thread(self.get_item_count_for_feed, *args, **kwargs)
+
+    async def aadd_items(self, *args, **kwargs) -> int:
+        """Async wrapper for add_items."""
+        return await asyncio.to_thread(self.add_items, *args, **kwargs)
+
+    async def aget_items_by_feed_id(self, *args, **kwargs) -> list[Item]:
+        """Async wrapper for get_items_by_feed_id."""
+        return await asyncio.to_thread(self.get_items_by_feed_id, *args, **kwargs)
+
+    async def aget_recent_items(self, *args, **kwargs) -> tuple[list[dict], int]:
+        """Async wrapper for get_recent_items."""
+        return await asyncio.to_thread(self.get_recent_items, *args, **kwargs)
+
+    async def aget_total_item_count(self, *args, **kwargs) -> int:
+        """Async wrapper for get_total_item_count."""
+        return await asyncio.to_thread(self.get_total_item_count, *args, **kwargs)
+
+    async def aget_new_items_count_since(self, *args, **kwargs) -> int:
+        """Async wrapper for get_new_items_count_since."""
+        return await asyncio.to_thread(self.get_new_items_count_since, *args, **kwargs)
+
+    async def aupdate_feed_last_fetched(self, *args, **kwargs) -> None:
+        """Async wrapper for update_feed_last_fetched."""
+        return await asyncio.to_thread(self.update_feed_last_fetched, *args, **kwargs)
+
+    async def aupdate_feed_error(self, *args, **kwargs) -> None:
+        """Async wrapper for update_feed_error."""
+        return await asyncio.to_thread(self.update_feed_error, *args, **kwargs)
+
+    async def areset_feed_error(self, *args, **kwargs) -> None:
+        """Async wrapper for reset_feed_error."""
+        return await asyncio.to_thread(self.reset_feed_error, *args, **kwargs)
+
+    async def arecord_poll_results(self, *args, **kwargs) -> int:
+        """Async wrapper for record_poll_results."""
+        return await asyncio.to_thread(self.record_poll_results, *args, **kwargs)
+
+    async def aget_active_feeds(self, *args, **kwargs) -> list[Feed]:
+        """Async wrapper for get_active_feeds."""
+        return await asyncio.to_thread(self.get_active_feeds, *args, **kwargs)
+
+    async def afind_feeds_by_identifier(self, *args, **kwargs) -> list[Feed]:
+        """Async wrapper for find_feeds_by_identifier."""
+        return await asyncio.to_thread(self.find_feeds_by_identifier, *args, **kwargs)
+
+    async def aresolve_feed(self, *args, **kwargs) -> list[Feed]:
+        """Async wrapper for resolve_feed."""
+        return await asyncio.to_thread(self.resolve_feed, *args, **kwargs)
+
+    async def aget_existing_guids(self, *args, **kwargs) -> set[str]:
+        """Async wrapper for get_existing_guids."""
+        return await asyncio.to_thread(self.get_existing_guids, *args, **kwargs)
+
+    async def aitem_exists_by_guid(self, *args, **kwargs) -> bool:
+        """Async wrapper for item_exists_by_guid."""
+        return await asyncio.to_thread(self.item_exists_by_guid, *args, **kwargs)
+
+    async def asearch_items(self, *args, **kwargs) -> list[dict]:
+        """Async wrapper for search_items."""
+        return await asyncio.to_thread(self.search_items, *args, **kwargs)
+
+    async def amark_items_read(self, *args, **kwargs) -> int:
+        """Async wrapper for mark_items_read."""
+        return await asyncio.to_thread(self.mark_items_read, *args, **kwargs)
+
+    async def amark_feed_items_read(self, *args, **kwargs) -> int:
+        """Async wrapper for mark_feed_items_read."""
+        return await asyncio.to_thread(self.mark_feed_items_read, *args, **kwargs)
+
+    async def amark_items_unread(self, *args, **kwargs) -> int:
+        """Async wrapper for mark_items_unread."""
+        return await asyncio.to_thread(self.mark_items_unread, *args, **kwargs)
 
 
 # --- Helper functions ---
@@ -428,6 +896,49 @@ def _str_to_dt(s: str | None) -> datetime | None:
     return datetime.fromisoformat(s)
 
 
+def _dt_to_ts(dt: datetime | int | None) -> int | None:
+    """Convert a datetime to a unix epoch integer for storage.
+
+    Naive datetimes are treated as UTC, matching the utc_now() values
+    used throughout. Epoch integers (e.g. from time.time()) pass through
+    untouched.
+    """
+    if dt is None:
+        return None
+    if isinstance(dt, int):
+        return dt
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _ts_to_dt(ts: int | str | None) -> datetime | None:
+    """Convert a stored unix epoch value back to a naive UTC datetime.
+
+    Databases created before the integer-timestamp migration have TEXT
+    affinity on these columns, which keeps the migrated epoch values as
+    numeric text — hence the int() cast.
+    """
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(int(ts), tz=timezone.utc).replace(tzinfo=None)
+
+
+def _rows_to_payloads(rows: list[sqlite3.Row]) -> list[dict]:
+    """Materialize shaped result rows (ITEM_RESULT_COLUMNS) as dicts.
+
+    Almost all shaping already happened in SQL; one pass over the rows
+    turns each into a dict (a C-level copy) and fixes up SQLite's integer
+    is_read into a proper boolean.
+    """
+    payloads = []
+    for r in rows:
+        payload = dict(r)
+        payload["is_read"] = bool(payload["is_read"])
+        payloads.append(payload)
+    return payloads
+
+
 def _row_to_feed(row: sqlite3.Row) -> Feed:
     """Convert a database row to a Feed dataclass."""
     return Feed(
@@ -436,11 +947,14 @@ def _row_to_feed(row: sqlite3.Row) -> Feed:
         title=row["title"],
         description=row["description"],
         site_link=row["site_link"],
-        last_fetched_at=_str_to_dt(row["last_fetched_at"]),
+        last_fetched_at=_ts_to_dt(row["last_fetched_at"]),
+        etag=row["etag"],
+        last_modified=row["last_modified"],
+        content_hash=row["content_hash"],
         error_count=row["error_count"],
         last_error=row["last_error"],
         is_active=bool(row["is_active"]),
-        created_at=_str_to_dt(row["created_at"]) or datetime.utcnow(),
+        created_at=_str_to_dt(row["created_at"]) or utc_now(),
     )
 
 
@@ -453,7 +967,7 @@ def _row_to_item(row: sqlite3.Row) -> Item:
         title=row["title"],
         link=row["link"],
         summary=row["summary"],
-        published_at=_str_to_dt(row["published_at"]),
+        published_at=_ts_to_dt(row["published_at"]),
         is_read=bool(row["is_read"]),
-        fetched_at=_str_to_dt(row["fetched_at"]) or datetime.utcnow(),
+        fetched_at=_ts_to_dt(row["fetched_at"]) or utc_now(),
     )
@@ -1,10 +1,19 @@
 """Data models for RSS Feed Agent."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime.
+
+    Naive-means-UTC is the convention throughout this package;
+    datetime.utcnow() said the same thing but is deprecated since 3.12.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
 class Feed:
     """Represents a subscribed RSS/Atom source."""
 
@@ -13,14 +22,17 @@ class Feed:
     description: str | None = None
     site_link: str | None = None
     last_fetched_at: datetime | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
     error_count: int = 0
     last_error: str | None = None
     is_active: bool = True
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
     id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Represents a single entry from a feed."""
 
@@ -31,5 +43,5 @@ class Item:
     summary: str | None = None
     published_at: datetime | None = None
     is_read: bool = False
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    fetched_at: datetime = field(default_factory=utc_now)
     id: int | None = None
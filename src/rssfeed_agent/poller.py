@@ -3,11 +3,10 @@
 import asyncio
 import logging
 import os
-from datetime import datetime
+import time
 
 from rssfeed_agent.database import Database
-from rssfeed_agent.feed_parser import FeedParseError, fetch_and_parse
-from rssfeed_agent.models import Item
+from rssfeed_agent.feed_parser import FeedParseError, fetch_and_parse_many
 
 logger = logging.getLogger(__name__)
 
@@ -15,48 +14,80 @@ DEFAULT_POLL_INTERVAL = 900  # 15 minutes
 
 
 async def poll_feeds_once(db: Database) -> int:
-    """Poll all active feeds once. Returns count of new items found."""
-    feeds = db.get_active_feeds()
-    total_new = 0
-
-    for feed in feeds:
+    """Poll all active feeds once. Returns count of new items found.
+
+    All feeds are fetched concurrently; results come back in feed order
+    with per-feed failures as FeedParseError entries.
+    """
+    feeds = await db.aget_active_feeds()
+
+    results = await fetch_and_parse_many(
+        [feed.url for feed in feeds],
+        validators=[(feed.etag, feed.last_modified) for feed in feeds],
+        content_hashes=[feed.content_hash for feed in feeds],
+    )
+
+    # Accumulate the whole cycle's writes; record_poll_results lands them
+    # in a single transaction instead of several commits per feed. One
+    # epoch integer stamps the whole cycle — last_fetched_at is stored as
+    # unix seconds, so no per-feed datetime gets built.
+    now = int(time.time())
+
+    batches: list[tuple[int, list[dict]]] = []
+    successes: list[tuple] = []
+    failures: list[tuple[int, str]] = []
+
+    for feed, parsed in zip(feeds, results):
         try:
-            parsed = await asyncio.to_thread(fetch_and_parse, feed.url)
-
-            # Build items, filtering out ones we already have
-            new_items = []
-            for item_data in parsed.items:
-                if not db.item_exists_by_guid(feed.id, item_data["guid"]):
-                    new_items.append(
-                        Item(
-                            feed_id=feed.id,
-                            guid=item_data["guid"],
-                            title=item_data["title"],
-                            link=item_data.get("link"),
-                            summary=item_data.get("summary"),
-                            published_at=item_data.get("published_at"),
-                        )
-                    )
-
-            if new_items:
-                inserted = db.add_items(new_items)
-                total_new += inserted
-                logger.info(
-                    "Feed '%s': %d new items", feed.title, inserted
+            if isinstance(parsed, FeedParseError):
+                raise parsed
+
+            if parsed is None:
+                # Feed unchanged (304 or identical body) — keep the stored
+                # validators and hash
+                successes.append(
+                    (feed.id, now, feed.etag, feed.last_modified, feed.content_hash)
                 )
+                continue
 
-            # Update last fetched and reset errors on success
-            db.update_feed_last_fetched(feed.id, datetime.utcnow())
-            db.reset_feed_error(feed.id)
+            # No pre-existence query: the UNIQUE(feed_id, guid) index
+            # rejects duplicates during the insert itself, and the insert
+            # rowcount reports how many were actually new.
+            batches.append((feed.id, parsed.items))
+            successes.append(
+                (feed.id, now, parsed.etag, parsed.last_modified, parsed.content_hash)
+            )
 
         except FeedParseError as e:
             logger.warning("Feed '%s' error: %s", feed.title, e)
-            db.update_feed_error(feed.id, str(e))
+            failures.append((feed.id, str(e)))
         except Exception as e:
             logger.warning("Feed '%s' unexpected error: %s", feed.title, e)
-            db.update_feed_error(feed.id, str(e))
+            failures.append((feed.id, str(e)))
+
+    def iter_rows():
+        """Stream row tuples straight into the bulk insert.
+
+        Rows are generated one at a time from the parsed entries already
+        in memory, so no cycle-wide row list ever materializes; an Item
+        dataclass per entry would likewise be allocated only to be
+        unpacked again at the insert.
+        """
+        for feed_id, entries in batches:
+            for item_data in entries:
+                yield (
+                    feed_id,
+                    item_data["guid"],
+                    item_data["title"],
+                    item_data.get("link"),
+                    item_data.get("summary"),
+                    item_data.get("published_at"),
+                )
 
-    return total_new
+    # Item inserts and feed-status updates land in one transaction: a
+    # single WAL commit per cycle, and status never reflects items that
+    # failed to persist.
+    return await db.arecord_poll_results(iter_rows(), successes, failures)
 
 
 async def start_polling(db: Database) -> None:
@@ -1,8 +1,10 @@
 """Agent tool implementations for RSS Feed Agent."""
 
-import json
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 
+import orjson
 from langchain_core.tools import tool
 
 from rssfeed_agent.database import Database
@@ -26,8 +28,17 @@ def _get_db() -> Database:
     return _db
 
 
+def _dumps(obj: dict) -> str:
+    """Serialize a tool result dict to JSON with orjson.
+
+    OPT_NAIVE_UTC lets datetime values serialize natively (naive
+    timestamps are UTC by convention here), so callers never need a
+    Python-level isoformat() pass first.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
 @tool
-def subscribe_to_feed(url: str) -> str:
+async def subscribe_to_feed(url: str) -> str:
     """Subscribe to an RSS or Atom feed by URL.
 
     Args:
@@ -36,18 +47,18 @@ def subscribe_to_feed(url: str) -> str:
     db = _get_db()
 
     # Check for existing subscription first
-    existing = db.get_feed_by_url(url)
+    existing = await db.aget_feed_by_url(url)
     if existing:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": "Already subscribed to this feed",
         })
 
     # Fetch and parse the feed
     try:
-        parsed = fetch_and_parse(url)
+        parsed = await asyncio.to_thread(fetch_and_parse, url)
     except FeedParseError as e:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": str(e),
         })
@@ -58,6 +69,9 @@ def subscribe_to_feed(url: str) -> str:
         title=parsed.title,
         description=parsed.description,
         site_link=parsed.site_link,
+        etag=parsed.etag,
+        last_modified=parsed.last_modified,
+        content_hash=parsed.content_hash,
     )
 
     items = [
@@ -74,9 +88,9 @@ def subscribe_to_feed(url: str) -> str:
 
     # Store in database
     try:
-        saved_feed, item_count = db.subscribe_to_feed(feed, items)
+        saved_feed, item_count = await db.asubscribe_to_feed(feed, items)
     except ValueError as e:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": str(e),
         })
@@ -95,11 +109,11 @@ def subscribe_to_feed(url: str) -> str:
     if parsed.warnings:
         result["warnings"] = parsed.warnings
 
-    return json.dumps(result)
+    return _dumps(result)
 
 
 @tool
-def get_items(
+async def get_items(
     feed_identifier: str = "",
     since: str = "",
     until: str = "",
@@ -120,24 +134,22 @@ def get_items(
     # Resolve feed_identifier to feed_id
     feed_id = None
     if feed_identifier:
-        matches = db.find_feeds_by_identifier(feed_identifier)
+        matches = await db.aresolve_feed(feed_identifier)
         if not matches:
-            return json.dumps({
+            return _dumps({
                 "status": "error",
                 "message": f"No feed found matching '{feed_identifier}'",
             })
-        if len(matches) == 1:
-            feed_id = matches[0].id
-        else:
-            # Multiple matches — use the best one (exact URL match or first title match)
-            exact = [f for f in matches if f.url == feed_identifier]
-            feed_id = exact[0].id if exact else matches[0].id
+        # Exact URL matches already come back alone; on a title tie, use
+        # the first match.
+        feed_id = matches[0].id
 
     # Parse date filters
     since_dt = _parse_iso_date(since) if since else None
     until_dt = _parse_iso_date(until) if until else None
 
-    items = db.get_recent_items(
+    # One query returns both the page and the full match count.
+    items, total = await db.aget_recent_items(
         feed_id=feed_id,
         limit=limit,
         since=since_dt,
@@ -145,49 +157,33 @@ def get_items(
         unread_only=unread_only,
     )
 
-    total = db.get_total_item_count(
-        feed_id=feed_id,
-        since=since_dt,
-        until=until_dt,
-        unread_only=unread_only,
-    )
-
-    return json.dumps({
-        "items": [
-            {
-                "id": item["id"],
-                "feed_title": item["feed_title"],
-                "title": item["title"],
-                "link": item["link"],
-                "summary": (item["summary"] or "")[:200],
-                "published_at": item["published_at"],
-                "is_read": item["is_read"],
-            }
-            for item in items
-        ],
+    # Rows come back from the database already in the emitted shape,
+    # summary truncation included.
+    return _dumps({
+        "items": items,
         "total": total,
         "has_more": total > limit,
     })
 
 
 @tool
-def list_feeds() -> str:
+async def list_feeds() -> str:
     """List all subscribed feeds with their current status.
 
     Returns each feed's id, title, url, status (active or erroring),
     last_fetched_at, error_count, and last_error if any.
     """
     db = _get_db()
-    feeds = db.get_all_feeds()
+    feeds = await db.aget_all_feeds()
 
-    return json.dumps({
+    return _dumps({
         "feeds": [
             {
                 "id": feed.id,
                 "title": feed.title,
                 "url": feed.url,
                 "status": "erroring" if feed.error_count > 0 else "active",
-                "last_fetched_at": feed.last_fetched_at.isoformat() if feed.last_fetched_at else None,
+                "last_fetched_at": feed.last_fetched_at,
                 "error_count": feed.error_count,
                 **({"last_error": feed.last_error} if feed.last_error else {}),
             }
@@ -198,7 +194,7 @@ def list_feeds() -> str:
 
 
 @tool
-def unsubscribe_from_feed(feed_identifier: str) -> str:
+async def unsubscribe_from_feed(feed_identifier: str) -> str:
     """Unsubscribe from a feed by its title or URL.
 
     Args:
@@ -206,36 +202,31 @@ def unsubscribe_from_feed(feed_identifier: str) -> str:
     """
     db = _get_db()
 
-    matches = db.find_feeds_by_identifier(feed_identifier)
+    matches = await db.aresolve_feed(feed_identifier)
     if not matches:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": f"No feed found matching '{feed_identifier}'",
         })
 
     if len(matches) > 1:
-        # Check for exact URL match first
-        exact = [f for f in matches if f.url == feed_identifier]
-        if len(exact) == 1:
-            matches = exact
-        else:
-            return json.dumps({
-                "status": "error",
-                "message": "Multiple feeds match. Please be more specific.",
-                "matches": [f.title for f in matches],
-            })
+        return _dumps({
+            "status": "error",
+            "message": "Multiple feeds match. Please be more specific.",
+            "matches": [f.title for f in matches],
+        })
 
     feed = matches[0]
-    db.delete_feed(feed.id)
+    await db.adelete_feed(feed.id)
 
-    return json.dumps({
+    return _dumps({
         "status": "unsubscribed",
         "feed_title": feed.title,
     })
 
 
 @tool
-def search_items(query: str, limit: int = 20) -> str:
+async def search_items(query: str, limit: int = 20) -> str:
     """Search feed items by keyword across titles and summaries.
 
     Args:
@@ -244,28 +235,17 @@ def search_items(query: str, limit: int = 20) -> str:
     """
     db = _get_db()
 
-    items = db.search_items(query, limit=limit)
+    items = await db.asearch_items(query, limit=limit)
 
-    return json.dumps({
-        "items": [
-            {
-                "id": item["id"],
-                "feed_title": item["feed_title"],
-                "title": item["title"],
-                "link": item["link"],
-                "summary": (item["summary"] or "")[:200],
-                "published_at": item["published_at"],
-                "is_read": item["is_read"],
-            }
-            for item in items
-        ],
+    return _dumps({
+        "items": items,
         "total": len(items),
         "has_more": False,
     })
 
 
 @tool
-def mark_as_read(
+async def mark_as_read(
     item_ids: list[int] | None = None,
     feed_identifier: str = "",
 ) -> str:
@@ -278,7 +258,7 @@ def mark_as_read(
     db = _get_db()
 
     if not item_ids and not feed_identifier:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": "Provide item_ids and/or feed_identifier",
         })
@@ -286,35 +266,31 @@ def mark_as_read(
     total_marked = 0
 
     if feed_identifier:
-        matches = db.find_feeds_by_identifier(feed_identifier)
+        matches = await db.aresolve_feed(feed_identifier)
         if not matches:
-            return json.dumps({
+            return _dumps({
                 "status": "error",
                 "message": f"No feed found matching '{feed_identifier}'",
             })
         if len(matches) > 1:
-            exact = [f for f in matches if f.url == feed_identifier]
-            if len(exact) == 1:
-                matches = exact
-            else:
-                return json.dumps({
-                    "status": "error",
-                    "message": "Multiple feeds match. Please be more specific.",
-                    "matches": [f.title for f in matches],
-                })
-        total_marked += db.mark_feed_items_read(matches[0].id)
+            return _dumps({
+                "status": "error",
+                "message": "Multiple feeds match. Please be more specific.",
+                "matches": [f.title for f in matches],
+            })
+        total_marked += await db.amark_feed_items_read(matches[0].id)
 
     if item_ids:
-        total_marked += db.mark_items_read(item_ids)
+        total_marked += await db.amark_items_read(item_ids)
 
-    return json.dumps({
+    return _dumps({
         "status": "success",
         "items_marked": total_marked,
     })
 
 
 @tool
-def mark_as_unread(item_ids: list[int]) -> str:
+async def mark_as_unread(item_ids: list[int]) -> str:
     """Mark one or more items as unread.
 
     Args:
@@ -322,16 +298,21 @@ def mark_as_unread(item_ids: list[int]) -> str:
     """
     db = _get_db()
 
-    marked = db.mark_items_unread(item_ids)
+    marked = await db.amark_items_unread(item_ids)
 
-    return json.dumps({
+    return _dumps({
         "status": "success",
         "items_marked": marked,
     })
 
 
+@lru_cache(maxsize=1024)
 def _parse_iso_date(date_str: str) -> datetime | None:
-    """Parse an ISO 8601 date string, returning None on failure."""
+    """Parse an ISO 8601 date string, returning None on failure.
+
+    Pure function of its (hashable) input, and agents tend to repeat the
+    same date window across a session, so results are memoized.
+    """
     if not date_str:
         return None
     try:
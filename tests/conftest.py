@@ -3,9 +3,12 @@
 import os
 import sqlite3
 import tempfile
-from unittest.mock import MagicMock
+import time
 
 import pytest
+from feedparser import FeedParserDict
+
+from rssfeed_agent.feed_parser import _parse_body
 
 
 SAMPLE_RSS_XML = """<?xml version="1.0" encoding="UTF-8"?>
@@ -77,52 +80,78 @@ def tmp_db_path():
         pass
 
 
-@pytest.fixture
+# The sample documents are immutable strings, so one session-wide
+# instance serves every test.
+@pytest.fixture(scope="session")
 def sample_rss_xml():
     """Sample valid RSS 2.0 XML."""
     return SAMPLE_RSS_XML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_atom_xml():
     """Sample valid Atom XML."""
     return SAMPLE_ATOM_XML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_malformed_xml():
     """Sample malformed RSS XML."""
     return SAMPLE_MALFORMED_XML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_not_a_feed_xml():
     """Sample XML that is not a feed."""
     return SAMPLE_NOT_A_FEED_XML
 
 
+@pytest.fixture(scope="session")
+def parsed_rss(sample_rss_xml):
+    """SAMPLE_RSS_XML parsed once into a ParsedFeed.
+
+    Tests that only consume parse output can take this instead of
+    re-running feedparser over the XML every time.
+    """
+    return _parse_body(sample_rss_xml.encode())
+
+
+@pytest.fixture(scope="session")
+def parsed_atom(sample_atom_xml):
+    """SAMPLE_ATOM_XML parsed once into a ParsedFeed."""
+    return _parse_body(sample_atom_xml.encode())
+
+
 @pytest.fixture
 def mock_feedparser_response():
-    """Create a mock feedparser response for a valid RSS feed."""
-    mock = MagicMock()
-    mock.bozo = False
-    mock.feed.title = "Test Feed"
-    mock.feed.description = "A test RSS feed"
-    mock.feed.link = "https://example.com"
-    mock.entries = [
-        MagicMock(
-            title="First Article",
-            link="https://example.com/article-1",
-            id="article-1",
-            summary="Description of the first article",
-            published_parsed=(2026, 2, 13, 10, 0, 0, 3, 44, 0),
-        ),
-        MagicMock(
-            title="Second Article",
-            link="https://example.com/article-2",
-            id="article-2",
-            summary="Description of the second article",
-            published_parsed=(2026, 2, 13, 9, 0, 0, 3, 44, 0),
+    """Create a fake feedparser response for a valid RSS feed.
+
+    Built from real FeedParserDicts rather than MagicMock: the code under
+    test reaches into results through both .get() and attribute access,
+    and FeedParserDict serves both without MagicMock's per-access
+    child-mock machinery.
+    """
+    return FeedParserDict(
+        bozo=False,
+        feed=FeedParserDict(
+            title="Test Feed",
+            description="A test RSS feed",
+            link="https://example.com",
         ),
-    ]
-    return mock
+        entries=[
+            FeedParserDict(
+                title="First Article",
+                link="https://example.com/article-1",
+                id="article-1",
+                summary="Description of the first article",
+                published_parsed=time.struct_time((2026, 2, 13, 10, 0, 0, 3, 44, 0)),
+            ),
+            FeedParserDict(
+                title="Second Article",
+                link="https://example.com/article-2",
+                id="article-2",
+                summary="Description of the second article",
+                published_parsed=time.struct_time((2026, 2, 13, 9, 0, 0, 3, 44, 0)),
+            ),
+        ],
+    )